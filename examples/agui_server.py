@@ -1,4 +1,9 @@
-"""Run the Agent Foundry AG-UI SSE server."""
+"""Run the Agent Foundry AG-UI SSE server.
+
+Runs uvicorn with the uvloop event loop and httptools HTTP parser (both ship
+with the fastapi[standard] extra) — our SSE streaming workload is event-loop
+bound and benefits directly.
+"""
 
 import uvicorn
 
@@ -7,10 +12,8 @@ from agent_foundry import create_app
 
 def main():
     app = create_app()
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
 
 
 if __name__ == "__main__":
     main()
-
-
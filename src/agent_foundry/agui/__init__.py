@@ -1,11 +1,14 @@
 """AG-UI integration helpers (events + SSE encoding)."""
 
 from .adapter import langchain_astream_events_to_agui_events
-from .encoding import sse_encode_event
+from .broadcast import SSEBroadcaster
+from .encoding import sse_encode_event, sse_encode_event_bytes
 from .ids import new_id
 
 __all__ = [
+    "SSEBroadcaster",
     "langchain_astream_events_to_agui_events",
     "sse_encode_event",
+    "sse_encode_event_bytes",
     "new_id",
 ]
@@ -8,12 +8,15 @@ https://docs.langchain.com/oss/python/langchain/streaming
 from __future__ import annotations
 
 import json
+import sys
 import time
 from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
 from ag_ui.core.events import (
     BaseEvent,
+    EventType,
     RunErrorEvent,
     RunFinishedEvent,
     RunStartedEvent,
@@ -30,45 +33,29 @@ from ag_ui.core.events import (
 
 from .ids import new_id
 
+# Interned block-type sentinels: comparing against an interned constant lets
+# CPython's unicode equality take the pointer-identity fast path when the
+# other side is interned too (short literals usually are).
+_T_TEXT = sys.intern("text")
+_T_TOOL_CHUNK = sys.intern("tool_call_chunk")
+
+# Prebound stdlib encoder for values orjson rejects (e.g. ints beyond 64 bits):
+# one instance at import time, no per-call kwargs parsing or encoder setup.
+_fallback_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
 
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    # Integer-only path: no float multiply/truncate round-trip.
+    return time.time_ns() // 1_000_000
 
 
 def _safe_json(obj: Any) -> str:
+    # default=str keeps the common case on one code path: non-serializable
+    # values are stringified inline instead of re-dumping the whole object.
     try:
-        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        return json.dumps(str(obj), ensure_ascii=False)
-
-
-def _extract_chunk_text(chunk: Any) -> str:
-    """Best-effort extraction of token delta text from LangChain chunks."""
-    if chunk is None:
-        return ""
-
-    # LangChain message chunks often have .content (str or list).
-    content = getattr(chunk, "content", None)
-    if isinstance(content, str):
-        return content
-    if isinstance(content, list):
-        # multimodal chunks are list of dicts/parts; best effort concatenate text-ish parts
-        parts: list[str] = []
-        for p in content:
-            if isinstance(p, str):
-                parts.append(p)
-            elif isinstance(p, dict):
-                # common pattern: {"type":"text","text":"..."}
-                t = p.get("text") if isinstance(p.get("text"), str) else None
-                if t:
-                    parts.append(t)
-        return "".join(parts)
-
-    # Sometimes chunk itself is a string.
-    if isinstance(chunk, str):
-        return chunk
-
-    return ""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return _fallback_dumps(obj)
 
 
 def _get_langgraph_node(metadata: dict[str, Any] | None) -> str | None:
@@ -78,29 +65,67 @@ def _get_langgraph_node(metadata: dict[str, Any] | None) -> str | None:
     return str(node) if node is not None else None
 
 
-def _iter_content_blocks(token: Any) -> list[dict[str, Any]]:
-    """Best-effort extraction of content_blocks from LangChain streamed tokens."""
-    content_blocks = getattr(token, "content_blocks", None)
-    if isinstance(content_blocks, list):
-        return [b for b in content_blocks if isinstance(b, dict)]
-
-    # Some tokens are AIMessageChunk with .content_blocks property; otherwise fallback to .content.
-    content = getattr(token, "content", None)
-    if isinstance(content, str) and content:
-        return [{"type": "text", "text": content}]
-    return []
-
-
-def _text_from_blocks(blocks: list[dict[str, Any]]) -> str:
-    parts: list[str] = []
-    for b in blocks:
-        if b.get("type") == "text" and isinstance(b.get("text"), str):
-            parts.append(b["text"])
-    return "".join(parts)
+def _split_blocks(token: Any) -> tuple[str, list[dict[str, Any]]]:
+    """Best-effort single-pass split of a streamed token into (text, tool_call_chunks).
 
+    Iterates the token's content_blocks exactly once, collecting text parts and
+    tool-call chunks together instead of re-walking the block list per kind.
+    """
+    content_blocks = getattr(token, "content_blocks", None)
+    if not isinstance(content_blocks, list):
+        # Some tokens are AIMessageChunk with .content_blocks property; otherwise fallback to .content.
+        content = getattr(token, "content", None)
+        if isinstance(content, str) and content:
+            return content, []
+        return "", []
+
+    # LangChain types content_blocks as list[dict]; trust it and skip
+    # per-block isinstance checks. Missing text joins as "" harmlessly.
+    text_parts: list[str] = []
+    tool_chunks: list[dict[str, Any]] = []
+    for b in content_blocks:
+        btype = b.get("type")
+        if btype == _T_TEXT:
+            text_parts.append(b.get("text") or "")
+        elif btype == _T_TOOL_CHUNK:
+            tool_chunks.append(b)
+    return "".join(text_parts), tool_chunks
+
+
+class _StreamState:
+    """Mutable per-stream adapter state.
+
+    A slotted instance keeps these off the generator's closure cells: reads
+    become LOAD_FAST + slot access instead of LOAD_DEREF on every token.
+    """
 
-def _tool_call_chunks_from_blocks(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return [b for b in blocks if b.get("type") == "tool_call_chunk"]
+    __slots__ = (
+        "message_id",
+        "current_node",
+        "active_tool_call_id",
+        "active_tool_call_name",
+        "last_tool_call_id",
+    )
+
+    def __init__(self) -> None:
+        self.message_id: str | None = None
+        self.current_node: str | None = None
+        self.active_tool_call_id: str | None = None
+        self.active_tool_call_name: str | None = None
+        # for linking tool outputs to the most recent call
+        self.last_tool_call_id: str | None = None
+
+
+def _step_switch(st: _StreamState, new_node: str | None, ts: int) -> list[BaseEvent]:
+    if new_node == st.current_node:
+        return []
+    out: list[BaseEvent] = []
+    if st.current_node is not None:
+        out.append(StepFinishedEvent(step_name=st.current_node, timestamp=ts))
+    if new_node is not None:
+        out.append(StepStartedEvent(step_name=new_node, timestamp=ts))
+    st.current_node = new_node
+    return out
 
 
 async def langchain_astream_events_to_agui_events(
@@ -122,27 +147,10 @@ async def langchain_astream_events_to_agui_events(
     thread_id = thread_id or new_id("thread")
     run_id = run_id or new_id("run")
 
-    message_id: str | None = None
-    current_node: str | None = None
-
-    active_tool_call_id: str | None = None
-    active_tool_call_name: str | None = None
-    last_tool_call_id: str | None = None  # for linking tool outputs to the most recent call
+    st = _StreamState()
 
     yield RunStartedEvent(thread_id=thread_id, run_id=run_id, timestamp=_now_ms())
 
-    def _step_switch(new_node: str | None) -> list[BaseEvent]:
-        nonlocal current_node
-        if new_node == current_node:
-            return []
-        out: list[BaseEvent] = []
-        if current_node is not None:
-            out.append(StepFinishedEvent(step_name=current_node, timestamp=_now_ms()))
-        if new_node is not None:
-            out.append(StepStartedEvent(step_name=new_node, timestamp=_now_ms()))
-        current_node = new_node
-        return out
-
     try:
         # Prefer "messages" mode for token/tool-call chunks + tool node outputs.
         async for token, metadata in runnable.astream(  # type: ignore[attr-defined]
@@ -150,12 +158,14 @@ async def langchain_astream_events_to_agui_events(
             config=config,
             stream_mode="messages",
         ):
+            # One timestamp per inbound token; every event derived from this
+            # token reuses it instead of paying a clock read each.
+            ts = _now_ms()
             node = _get_langgraph_node(metadata)
-            for step_ev in _step_switch(node):
+            for step_ev in _step_switch(st, node, ts):
                 yield step_ev
 
-            blocks = _iter_content_blocks(token)
-            tool_chunks = _tool_call_chunks_from_blocks(blocks)
+            text, tool_chunks = _split_blocks(token)
 
             # Tool call streaming (from model node)
             if tool_chunks:
@@ -164,77 +174,85 @@ async def langchain_astream_events_to_agui_events(
                 chunk_id = first.get("id")
                 chunk_name = first.get("name")
 
-                if chunk_id and chunk_id != active_tool_call_id:
+                if chunk_id and chunk_id != st.active_tool_call_id:
                     # Close previous tool call stream if any
-                    if active_tool_call_id is not None:
+                    if st.active_tool_call_id is not None:
                         yield ToolCallEndEvent(
-                            tool_call_id=active_tool_call_id, timestamp=_now_ms()
+                            tool_call_id=st.active_tool_call_id, timestamp=ts
                         )
-                    active_tool_call_id = str(chunk_id)
-                    active_tool_call_name = str(chunk_name) if chunk_name else "tool"
-                    last_tool_call_id = active_tool_call_id
+                    st.active_tool_call_id = str(chunk_id)
+                    st.active_tool_call_name = str(chunk_name) if chunk_name else "tool"
+                    st.last_tool_call_id = st.active_tool_call_id
 
                     yield ToolCallStartEvent(
-                        tool_call_id=active_tool_call_id,
-                        tool_call_name=active_tool_call_name,
-                        parent_message_id=message_id,
-                        timestamp=_now_ms(),
+                        tool_call_id=st.active_tool_call_id,
+                        tool_call_name=st.active_tool_call_name,
+                        parent_message_id=st.message_id,
+                        timestamp=ts,
                     )
 
-                # Stream args deltas (including chunks with id=None/name=None but args fragments)
-                if active_tool_call_id is not None:
-                    for c in tool_chunks:
-                        args = c.get("args")
-                        if isinstance(args, str) and args:
-                            yield ToolCallArgsEvent(
-                                tool_call_id=active_tool_call_id,
-                                delta=args,
-                                timestamp=_now_ms(),
-                            )
+                # Stream args deltas (including chunks with id=None/name=None but args fragments).
+                # Fragments within one inbound token are coalesced into a single
+                # event — concatenated deltas are wire-equivalent for clients.
+                if st.active_tool_call_id is not None:
+                    delta = "".join(
+                        c["args"] for c in tool_chunks if isinstance(c.get("args"), str)
+                    )
+                    if delta:
+                        # model_construct skips pydantic validation; all
+                        # fields here are already the declared types.
+                        yield ToolCallArgsEvent.model_construct(
+                            type=EventType.TOOL_CALL_ARGS,
+                            tool_call_id=st.active_tool_call_id,
+                            delta=delta,
+                            timestamp=ts,
+                        )
 
                 continue
 
             # If we leave model node while a tool call is open, close it.
-            if active_tool_call_id is not None and node and node != "model":
-                yield ToolCallEndEvent(tool_call_id=active_tool_call_id, timestamp=_now_ms())
-                active_tool_call_id = None
-                active_tool_call_name = None
+            if st.active_tool_call_id is not None and node and node != "model":
+                yield ToolCallEndEvent(tool_call_id=st.active_tool_call_id, timestamp=ts)
+                st.active_tool_call_id = None
+                st.active_tool_call_name = None
 
             # Tool node text becomes ToolCallResult (best-effort) and also may be shown as assistant text later.
             if node == "tools":
-                tool_text = _text_from_blocks(blocks)
-                if tool_text and last_tool_call_id:
+                if text and st.last_tool_call_id:
                     yield ToolCallResultEvent(
                         message_id=new_id("toolmsg"),
-                        tool_call_id=last_tool_call_id,
-                        content=tool_text,
+                        tool_call_id=st.last_tool_call_id,
+                        content=text,
                         role="tool",
-                        timestamp=_now_ms(),
+                        timestamp=ts,
                     )
                 continue
 
             # Assistant text streaming (typically model node)
-            delta = _text_from_blocks(blocks)
-            if delta:
-                if message_id is None:
-                    message_id = new_id("msg")
+            if text:
+                if st.message_id is None:
+                    st.message_id = new_id("msg")
                     yield TextMessageStartEvent(
-                        message_id=message_id, role="assistant", timestamp=_now_ms()
+                        message_id=st.message_id, role="assistant", timestamp=ts
                     )
-                yield TextMessageContentEvent(
-                    message_id=message_id, delta=delta, timestamp=_now_ms()
+                # model_construct skips pydantic validation; fields are known-good.
+                yield TextMessageContentEvent.model_construct(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    message_id=st.message_id,
+                    delta=text,
+                    timestamp=ts,
                 )
 
         # Close any open tool call
-        if active_tool_call_id is not None:
-            yield ToolCallEndEvent(tool_call_id=active_tool_call_id, timestamp=_now_ms())
+        if st.active_tool_call_id is not None:
+            yield ToolCallEndEvent(tool_call_id=st.active_tool_call_id, timestamp=_now_ms())
 
         # Close any open message stream
-        if message_id is not None:
-            yield TextMessageEndEvent(message_id=message_id, timestamp=_now_ms())
+        if st.message_id is not None:
+            yield TextMessageEndEvent(message_id=st.message_id, timestamp=_now_ms())
 
-        if current_node is not None:
-            yield StepFinishedEvent(step_name=current_node, timestamp=_now_ms())
+        if st.current_node is not None:
+            yield StepFinishedEvent(step_name=st.current_node, timestamp=_now_ms())
 
         yield RunFinishedEvent(thread_id=thread_id, run_id=run_id, timestamp=_now_ms())
     except Exception as e:
@@ -0,0 +1,70 @@
+"""Broadcast fan-out of encoded SSE frames to multiple subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from ag_ui.core.events import BaseEvent
+
+from .encoding import sse_encode_event_bytes
+
+
+class SSEBroadcaster:
+    """Fan one AG-UI event stream out to many SSE subscribers.
+
+    Each event is encoded exactly once and the same bytes frame is handed to
+    every subscriber queue, so serialization cost scales with events rather
+    than events x subscribers.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._queues: set[asyncio.Queue[bytes | None]] = set()
+        self._closed = False
+
+    def publish(self, event: BaseEvent) -> None:
+        """Encode the event once and enqueue the frame for every subscriber."""
+        frame = sse_encode_event_bytes(event)
+        for q in self._queues:
+            try:
+                q.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Slow subscriber: drop its frame rather than stall the run.
+                pass
+
+    def close(self) -> None:
+        """Signal end-of-stream to all subscribers."""
+        self._closed = True
+        for q in self._queues:
+            try:
+                q.put_nowait(None)
+            except asyncio.QueueFull:
+                # The close marker must always land or the subscriber would
+                # block in get() forever; evict the oldest pending frame to
+                # make room (the stream is ending anyway).
+                q.get_nowait()
+                q.put_nowait(None)
+
+    async def subscribe(self) -> AsyncIterator[bytes]:
+        """Yield encoded frames until the broadcaster is closed."""
+        if self._closed:
+            return
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self._maxsize)
+        self._queues.add(queue)
+        try:
+            while True:
+                frame = await queue.get()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._queues.discard(queue)
+
+    async def pump(self, events: AsyncIterator[BaseEvent]) -> None:
+        """Publish every event from an adapter stream, then close."""
+        try:
+            async for event in events:
+                self.publish(event)
+        finally:
+            self.close()
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import orjson
 from ag_ui.core.events import BaseEvent
-from ag_ui.encoder import EventEncoder
 
-_encoder = EventEncoder()
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def sse_encode_event_bytes(event: BaseEvent) -> bytes:
+    """Encode an AG-UI event into an SSE 'data: ...\\n\\n' frame as bytes.
+
+    Bypasses ag_ui's `EventEncoder` (pydantic `model_dump_json`) on the hot
+    path: dump the event once, then serialize with orjson. Yielding bytes lets
+    the ASGI layer send frames without a str->bytes re-encode per event. Wire
+    format (camelCase aliases, omitted nulls) matches the upstream encoder.
+    """
+    payload = event.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
 
 
 def sse_encode_event(event: BaseEvent) -> str:
-    """Encode an AG-UI event into an SSE 'data: ...\\n\\n' frame."""
-    return _encoder.encode(event)
+    """Encode an AG-UI event into an SSE 'data: ...\\n\\n' frame as str.
+
+    Kept for callers (and tests) that want text frames; the server streams the
+    bytes variant.
+    """
+    return sse_encode_event_bytes(event).decode()
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
+import secrets
+
+# Per-call entropy reads are overkill for opaque stream ids: a pid + random
+# boot seed guards against collisions across workers and restarts, and the
+# counter (atomic under the GIL) makes each call allocation-only.
+_PID = os.getpid()
+_BOOT = secrets.token_hex(4)
+_COUNTER = itertools.count()
 
 
 def new_id(prefix: str) -> str:
     """Generate a stable-ish opaque id with a human-friendly prefix."""
-    return f"{prefix}_{uuid.uuid4().hex}"
+    return f"{prefix}_{_PID:x}{_BOOT}{next(_COUNTER):x}"
@@ -18,5 +18,11 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_base_url: str = ""
 
+    # SSE write batching window (ms): frames are coalesced into one send, with
+    # the flush deadline anchored at the first buffered frame, so no frame is
+    # ever delayed longer than the window. 0 disables coalescing and writes
+    # every frame immediately.
+    agui_batch_ms: int = 2
+
 
 settings = Settings()
@@ -1,10 +1,12 @@
 """AgentFactory for building LangChain agents from AgentSpec."""
 
 import logging
+from collections.abc import Mapping
 
 from langchain.agents import create_agent
 from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
+from langchain_openai import ChatOpenAI
 
 from .config import settings
 from .constants import Defaults, ModelTypes
@@ -27,7 +29,7 @@ class AgentFactory:
     """
 
     @staticmethod
-    def get_model_instance(model: str, temperature: float | None = None):
+    def get_model_instance(model: str, temperature: float | None = None) -> ChatOpenAI:
         """
         Get LLM instance from model string.
 
@@ -54,7 +56,7 @@ class AgentFactory:
             )
 
     @staticmethod
-    def _load_tools(tool_names: list[str], all_available_tools: dict) -> list[BaseTool]:
+    def _load_tools(tool_names: list[str], all_available_tools: Mapping) -> list[BaseTool]:
         """
         Load tools from the global registry.
 
@@ -136,7 +138,7 @@ class AgentFactory:
     @staticmethod
     def assemble_agent(
         agent_spec: AgentSpec,
-        all_available_tools: dict,
+        all_available_tools: Mapping,
     ) -> Runnable:
         """
         Assemble an agent from an AgentSpec.
@@ -177,14 +179,17 @@ class AgentFactory:
         )
 
         logger.info(
-            f"Assembled agent '{agent_spec.name}' with {len(tools)} tools, "
-            f"model={agent_spec.model}, temperature={agent_spec.temperature}"
+            "Assembled agent '%s' with %d tools, model=%s, temperature=%s",
+            agent_spec.name,
+            len(tools),
+            agent_spec.model,
+            agent_spec.temperature,
         )
 
         return agent
 
     @staticmethod
-    def _build_subagent_tool(subagent_spec: SubAgentSpec, all_available_tools: dict) -> BaseTool:
+    def _build_subagent_tool(subagent_spec: SubAgentSpec, all_available_tools: Mapping) -> BaseTool:
         """
         Build a subagent and wrap it as a tool.
 
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from langchain.agents import create_agent
 from langchain.tools import ToolRuntime, tool
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from .constants import MasterAgentPrompts
 from .factory import AgentFactory
@@ -29,8 +30,19 @@ async def _build_system_prompt() -> str:
     return MasterAgentPrompts.SYSTEM_PROMPT.replace("{tool_catalog}", tool_catalog)
 
 
+# Formatted catalog cache: (registry version, formatted string). The registry
+# is effectively static after startup, so most builds hit this.
+_catalog_cache: tuple[int, str] | None = None
+
+
 async def _format_tool_catalog() -> str:
     """Format available tools for the system prompt using tool registry."""
+    global _catalog_cache
+
+    version = tool_registry.version
+    if _catalog_cache is not None and _catalog_cache[0] == version:
+        return _catalog_cache[1]
+
     try:
         tools = await tool_registry.get_catalog()
     except RuntimeError:
@@ -51,7 +63,9 @@ async def _format_tool_catalog() -> str:
 
         catalog_lines.append("")
 
-    return "\n".join(catalog_lines).strip()
+    catalog = "\n".join(catalog_lines).strip()
+    _catalog_cache = (version, catalog)
+    return catalog
 
 
 class Context(BaseModel):
@@ -59,6 +73,25 @@ class Context(BaseModel):
 
     agent_spec: AgentSpec | None = None
 
+    _agent_spec_json: bytes | None = PrivateAttr(default=None)
+    _agent_spec_json_for: AgentSpec | None = PrivateAttr(default=None)
+
+    def agent_spec_json(self) -> bytes | None:
+        """JSON bytes of agent_spec, serialized once per spec assignment.
+
+        The master stream emits the spec at its tail; caching here means a
+        retransmit (or future re-read) skips the model_dump + dumps pass.
+        The cached bytes are tied to the spec object itself (identity
+        comparison), so replacing the spec always reserializes.
+        """
+        spec = self.agent_spec
+        if spec is None:
+            return None
+        if self._agent_spec_json is None or self._agent_spec_json_for is not spec:
+            self._agent_spec_json = orjson.dumps(spec.model_dump(mode="json"))
+            self._agent_spec_json_for = spec
+        return self._agent_spec_json
+
 
 class MasterAgent:
     """
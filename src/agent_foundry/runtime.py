@@ -8,6 +8,7 @@ from an `AgentSpec`.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from .factory import AgentFactory
@@ -46,7 +47,7 @@ class Runtime:
     async def build(
         cls,
         agent_spec: AgentSpec,
-        all_available_tools: dict[str, Any],
+        all_available_tools: Mapping[str, Any],
     ) -> CompiledStateGraph[Any, RuntimeContext, Any, Any]:
         """
         Build a production-ready compiled LangGraph agent from an `AgentSpec`.
@@ -56,7 +57,7 @@ class Runtime:
 
         Args:
             agent_spec: Agent specification model.
-            all_available_tools: Dictionary mapping tool name to tool instance.
+            all_available_tools: Mapping of tool name to tool instance.
 
         Returns:
             Compiled LangGraph agent graph ready for invocation.
@@ -101,3 +101,18 @@ class ChatUserMessage(BaseModel):
 class CommonChatReq(BaseModel):
     sessionId: str | None = Field(default=None, description="会话id，null 表示创建会话")
     message: ChatUserMessage = Field(description="用户消息对象")
+
+
+# RuntimeContext references AgentSpec before it is defined (postponed
+# annotations), so pydantic defers its core schema; rebuild all models here so
+# the first request after process start doesn't pay one-off schema building.
+for _model in (
+    RuntimeContext,
+    SubAgentSpec,
+    AgentSpec,
+    ClarifyingQuestion,
+    AskClarifyingQuestionsArgs,
+    ChatUserMessage,
+    CommonChatReq,
+):
+    _model.model_rebuild()
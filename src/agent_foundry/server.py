@@ -2,56 +2,232 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import AsyncIterator
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Mapping
+from contextlib import aclosing, asynccontextmanager, suppress
 from typing import Any
 
-from ag_ui.core.events import CustomEvent
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from ag_ui.core.events import BaseEvent
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from .agui.adapter import langchain_astream_events_to_agui_events
-from .agui.encoding import sse_encode_event
+from .agui.encoding import sse_encode_event_bytes
 from .agui.ids import new_id
+from .config import settings
 from .master_agent import Context, MasterAgent
 from .runtime import Runtime
 from .schemas import AgentSpec, CommonChatReq
 from .tools.registry import tool_registry
 
+logger = logging.getLogger(__name__)
+
+# Core schema built once at import; validate_python reuses it per request
+# instead of paying AgentSpec(**raw) construction overhead each time.
+_AGENT_SPEC_ADAPTER = TypeAdapter(AgentSpec)
+
+# Compiled runtime cache keyed on (canonical spec JSON, registry version):
+# repeat runs with an identical spec — typical for an interactive session —
+# reuse the built agent instead of re-binding tools and LLM clients. The
+# version component makes entries built against an older tool set unreachable
+# after a register().
+_RUNTIME_CACHE_MAX = 64
+_runtime_cache: dict[tuple[bytes, int], Any] = {}
+_runtime_cache_lock = asyncio.Lock()
+
+
+async def _get_runtime(spec: AgentSpec, available_tools: Mapping[str, Any]) -> Any:
+    key = (
+        orjson.dumps(spec.model_dump(), option=orjson.OPT_SORT_KEYS),
+        tool_registry.version,
+    )
+    async with _runtime_cache_lock:
+        runnable = _runtime_cache.get(key)
+    if runnable is not None:
+        logger.debug("Runtime cache hit for agent '%s'", spec.name)
+        return runnable
+    runnable = await Runtime.build(agent_spec=spec, all_available_tools=available_tools)
+    async with _runtime_cache_lock:
+        if len(_runtime_cache) >= _RUNTIME_CACHE_MAX:
+            # FIFO eviction: drop the oldest entry.
+            _runtime_cache.pop(next(iter(_runtime_cache)))
+        _runtime_cache[key] = runnable
+    return runnable
+
+
+# SSE response headers: disable proxy/server buffering so frames reach the
+# client as soon as they are yielded (serialization itself already happens
+# natively in orjson, see agui.encoding).
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# SSE comment frame sent during idle gaps so proxies don't time out long tool calls.
+_KEEPALIVE_INTERVAL_S = 15.0
+_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# Above this payload size, serialization moves off the event loop so one huge
+# tool result can't stall every other connected stream.
+_LARGE_EVENT_BYTES = 16_384
+
+
+async def _encode_frame(event: BaseEvent) -> bytes:
+    """Encode one event; large text payloads are serialized in a thread."""
+    text = getattr(event, "delta", None) or getattr(event, "content", None)
+    if isinstance(text, str) and len(text) > _LARGE_EVENT_BYTES:
+        return await asyncio.to_thread(sse_encode_event_bytes, event)
+    return sse_encode_event_bytes(event)
+
+
+def _fast_sse(name: str, value_json: bytes) -> bytes:
+    """Frame a CUSTOM event from pre-serialized value bytes, skipping pydantic entirely."""
+    return b'data: {"type":"CUSTOM","name":"' + name.encode() + b'","value":' + value_json + b"}\n\n"
+
+
+# Flush the write buffer whenever it grows past this, regardless of the window.
+_FLUSH_BYTES = 4096
+
+# Bound on frames buffered between the upstream LangChain stream and the HTTP
+# client; a full queue suspends the producer, giving natural backpressure.
+_QUEUE_MAXSIZE = 64
+_SENTINEL: Any = object()
+
+
+async def _pump_frames(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield frames, coalescing bursts into single writes and keeping the pipe alive.
+
+    A producer task drains the upstream iterator into a bounded queue; when a
+    slow client lets the queue fill, the producer suspends on put(), so the
+    LangChain stream cannot buffer unbounded in memory.
+
+    On the consumer side, frames arriving within the `agui_batch_ms` window
+    are concatenated into one send — SSE frames are self-delimiting, so
+    concatenation is wire-equivalent. The flush deadline is anchored at the
+    first frame placed in the buffer, so under sustained sub-window arrivals
+    no frame is ever held longer than the window (the 4 KiB size backstop can
+    only flush earlier), keeping time-to-first-token intact. Idle gaps emit
+    ': keepalive' comment frames. Uses `asyncio.wait` with a timeout instead
+    of `asyncio.wait_for` so ticks don't raise/cancel anything.
+    """
+    batch_s = settings.agui_batch_ms / 1000.0
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+    loop = asyncio.get_running_loop()
+
+    async def _produce() -> None:
+        try:
+            # aclosing guarantees the upstream generator's cleanup runs even
+            # when this task is cancelled mid-put.
+            async with aclosing(frames) as upstream:
+                async for frame in upstream:
+                    await queue.put(frame)
+        except asyncio.CancelledError:
+            # Cancelled means the consumer is gone (client disconnect); a
+            # blocking sentinel put on a full queue would never complete and
+            # would pin this task forever.
+            raise
+        except BaseException:
+            await queue.put(_SENTINEL)
+            raise
+        else:
+            await queue.put(_SENTINEL)
+
+    producer = asyncio.create_task(_produce())
+    get_task: asyncio.Task[Any] | None = None
+    buf = bytearray()
+    deadline = 0.0  # flush deadline; anchored when the first frame enters buf
+    try:
+        while True:
+            if get_task is None:
+                get_task = asyncio.ensure_future(queue.get())
+            # The deadline doesn't reset on later frames, so a full buffer
+            # never waits past agui_batch_ms from its oldest frame.
+            timeout = max(0.0, deadline - loop.time()) if buf else _KEEPALIVE_INTERVAL_S
+            done, _ = await asyncio.wait({get_task}, timeout=timeout)
+            if not done:
+                if buf:
+                    yield bytes(buf)
+                    buf.clear()
+                else:
+                    yield _KEEPALIVE_FRAME
+                continue
+            item, get_task = get_task.result(), None
+            if item is _SENTINEL:
+                break
+            if not buf:
+                deadline = loop.time() + batch_s
+            buf += item
+            # batch_s <= 0 disables coalescing: every frame flushes immediately.
+            if len(buf) >= _FLUSH_BYTES or batch_s <= 0:
+                yield bytes(buf)
+                buf.clear()
+        if buf:
+            yield bytes(buf)
+        # Surface upstream errors (the adapter re-raises after RunErrorEvent).
+        await producer
+    finally:
+        if get_task is not None:
+            get_task.cancel()
+        # Client disconnect closes this generator; stop the upstream run and
+        # wait for its cleanup so no producer task is left behind.
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
+
+
+# Role -> message-class dispatch; unknown roles fall back to user text.
+_ROLE_MAP = {
+    "user": HumanMessage,
+    "system": SystemMessage,
+    "assistant": AIMessage,
+}
+
 
 def _agui_messages_to_langchain(messages: list[dict[str, Any]]) -> list[Any]:
-    """Convert AG-UI-style message dicts to LangChain message objects."""
+    """Convert AG-UI-style message dicts to LangChain message objects.
+
+    Single pass over the wire payload: content is normalized here, so the
+    messages are built with model_construct instead of paying LangChain's
+    pydantic validation per message.
+    """
     converted: list[Any] = []
     for m in messages:
-        role = m.get("role")
+        cls = _ROLE_MAP.get(m.get("role"))
         content = m.get("content", "")
-        if role == "user":
-            converted.append(HumanMessage(content=content))
-        elif role == "system":
-            converted.append(SystemMessage(content=content))
-        elif role == "assistant":
-            converted.append(AIMessage(content=content))
-        else:
+        if cls is None:
             # Unsupported/unknown roles are passed through as user text for now.
-            converted.append(HumanMessage(content=str(content)))
+            cls, content = HumanMessage, str(content)
+        elif not isinstance(content, str | list):
+            content = str(content)
+        converted.append(cls.model_construct(content=content))
     return converted
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="agent_foundry (AG-UI)")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Build the master agent once per process; requests only create a
+        # fresh Context. Rebuilding per request paid LLM-client construction
+        # and pydantic schema binding on every call.
+        app.state.master = await MasterAgent.build()
+        yield
+
+    app = FastAPI(title="agent_foundry (AG-UI)", lifespan=lifespan)
 
-    async def _master_stream_response(req: CommonChatReq) -> StreamingResponse:
+    async def _master_stream_response(req: CommonChatReq, master: Any) -> StreamingResponse:
         thread_id = req.sessionId or new_id("thread")
         run_id = req.message.id or new_id("run")
 
-        master = await MasterAgent.build()
         context = Context()
 
         lc_messages = [HumanMessage(content=req.message.content)]
 
-        async def stream() -> AsyncIterator[str]:
+        async def stream() -> AsyncIterator[bytes]:
             async for event in langchain_astream_events_to_agui_events(
                 runnable=master,
                 input={"messages": lc_messages},
@@ -59,18 +235,15 @@ def create_app() -> FastAPI:
                 thread_id=thread_id,
                 run_id=run_id,
             ):
-                yield sse_encode_event(event)
+                yield await _encode_frame(event)
 
-            if context.agent_spec is not None:
+            spec_json = context.agent_spec_json()
+            if spec_json is not None:
+                yield _fast_sse("agent_spec", spec_json)
 
-                yield sse_encode_event(
-                    CustomEvent(
-                        name="agent_spec",
-                        value=context.agent_spec.model_dump(),
-                    )
-                )
-
-        return StreamingResponse(stream(), media_type="text/event-stream")
+        return StreamingResponse(
+            _pump_frames(stream()), media_type="text/event-stream", headers=_SSE_HEADERS
+        )
 
     async def _runtime_stream_response(payload: dict[str, Any]) -> StreamingResponse:
         thread_id = payload.get("thread_id") or new_id("thread")
@@ -81,16 +254,16 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=422, detail="agent_spec is required")
 
         try:
-            spec = AgentSpec(**spec_raw)
+            spec = _AGENT_SPEC_ADAPTER.validate_python(spec_raw)
         except ValidationError as e:
             # Return structured validation errors instead of 500 so the frontend can surface it.
             raise HTTPException(status_code=422, detail=e.errors()) from e
         available_tools = tool_registry.get_all()
-        runnable = await Runtime.build(agent_spec=spec, all_available_tools=available_tools)
+        runnable = await _get_runtime(spec, available_tools)
 
         lc_messages = _agui_messages_to_langchain(messages)
 
-        async def stream() -> AsyncIterator[str]:
+        async def stream() -> AsyncIterator[bytes]:
             async for event in langchain_astream_events_to_agui_events(
                 runnable=runnable,
                 input={"messages": lc_messages},
@@ -98,24 +271,33 @@ def create_app() -> FastAPI:
                 thread_id=thread_id,
                 run_id=run_id,
             ):
-                yield sse_encode_event(event)
+                yield await _encode_frame(event)
 
-        return StreamingResponse(stream(), media_type="text/event-stream")
+        return StreamingResponse(
+            _pump_frames(stream()), media_type="text/event-stream", headers=_SSE_HEADERS
+        )
 
     @app.post("/agui/master/run")
-    async def agui_master_run(req: CommonChatReq) -> StreamingResponse:
-        return await _master_stream_response(req)
+    async def agui_master_run(req: CommonChatReq, request: Request) -> StreamingResponse:
+        return await _master_stream_response(req, request.app.state.master)
 
     @app.post("/agui/runtime/run")
-    async def agui_runtime_run(payload: dict[str, Any]) -> StreamingResponse:
+    async def agui_runtime_run(request: Request) -> StreamingResponse:
+        """POST variant; the body is decoded with orjson straight off the wire."""
+        try:
+            payload = orjson.loads(await request.body())
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=422, detail=f"Invalid payload JSON: {e}") from e
+        if not isinstance(payload, dict):
+            raise HTTPException(status_code=422, detail="payload must be a JSON object")
         return await _runtime_stream_response(payload)
 
     @app.get("/agui/runtime/run")
     async def agui_runtime_run_get(payload: str = Query(...)) -> StreamingResponse:
         """GET variant for EventSource clients (payload is URL-encoded JSON)."""
         try:
-            decoded = json.loads(payload)
-        except Exception as e:
+            decoded = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=422, detail=f"Invalid payload JSON: {e}") from e
         if not isinstance(decoded, dict):
             raise HTTPException(status_code=422, detail="payload must be a JSON object")
@@ -1,6 +1,8 @@
 """SubAgentTool: Wraps a sub-agent as a LangChain BaseTool."""
 
 import logging
+import sys
+from functools import singledispatch
 from typing import Any
 
 from langchain_core.messages import AIMessage, HumanMessage
@@ -10,6 +12,51 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Shared empty scratchpad: agents treat input state as read-only, so every
+# call can reference the same list instead of allocating one. Never mutate.
+_EMPTY_SCRATCHPAD: list[Any] = []
+
+# Interned result-dict keys for the extraction fast path.
+_OUTPUT_KEY = sys.intern("output")
+_MESSAGES_KEY = sys.intern("messages")
+
+
+@singledispatch
+def _extract(result: Any) -> str:
+    """Extract the output string from a sub-agent result (fallback for unknown types)."""
+    logger.warning("Unknown result type from sub-agent: %s", type(result))
+    return str(result)
+
+
+@_extract.register
+def _extract_from_dict(result: dict) -> str:
+    # Priority 1: Direct 'output' key — the dominant path; the value is
+    # typically already a str, so skip the redundant coercion.
+    out = result.get(_OUTPUT_KEY)
+    if out is not None:
+        return out if isinstance(out, str) else str(out)
+
+    # Priority 2: Last message from 'messages' key
+    messages = result.get(_MESSAGES_KEY)
+    if messages:
+        last_message = messages[-1]
+        if isinstance(last_message, AIMessage):
+            return str(last_message.content)
+        return str(last_message)
+
+    # Priority 3: String representation of the dict
+    return str(result)
+
+
+@_extract.register
+def _extract_from_message(result: AIMessage) -> str:
+    return str(result.content)
+
+
+@_extract.register
+def _extract_from_str(result: str) -> str:
+    return result
+
 
 class SubAgentToolInput(BaseModel):
     """Input schema for SubAgentTool."""
@@ -65,50 +112,16 @@ class SubAgentTool(BaseTool):
         **kwargs: Any,
     ) -> str:
         """
-        Run the sub-agent with the given task.
+        Sync execution is not supported; use the async path.
 
-        Args:
-            task: Task description for the sub-agent
-            run_manager: Optional callback manager
-            **kwargs: Additional arguments
-
-        Returns:
-            Sub-agent execution result as string
-
-        Example:
-            ```python
-            tool = SubAgentTool(
-                name="data_analyzer",
-                description="Analyzes data and generates insights",
-                subagent=subagent_runnable
-            )
-            result = tool._run("Analyze this dataset and find patterns")
-            ```
+        The server is fully async and LangChain dispatches to `_arun` when it
+        exists. Running sub-agents through a sync entry point would detour
+        every call through the framework thread pool, so it is disabled
+        rather than silently degraded.
         """
-        logger.info(f"Sub-agent '{self.name}' executing task: {task[:100]}...")
-
-        try:
-            # Prepare input for the sub-agent
-            # The sub-agent expects messages in the format: {"messages": [...]}
-            input_data = {
-                "messages": [HumanMessage(content=task)],
-                "agent_scratchpad": [],
-            }
-
-            # Run the sub-agent
-            result = self.subagent.invoke(input_data)
-
-            # Extract the output
-            # The result format depends on how the agent is structured
-            # For create_tool_calling_agent, it's typically an AIMessage
-            output = self._extract_output(result)
-
-            logger.info(f"Sub-agent '{self.name}' completed task successfully")
-            return output
-
-        except Exception as e:
-            logger.error(f"Sub-agent '{self.name}' failed: {e}")
-            raise Exception(f"Sub-agent '{self.name}' error: {str(e)}") from e
+        raise NotImplementedError(
+            f"SubAgentTool '{self.name}' is async-only; invoke it via _arun/ainvoke."
+        )
 
     async def _arun(
         self,
@@ -117,7 +130,7 @@ class SubAgentTool(BaseTool):
         **kwargs: Any,
     ) -> str:
         """
-        Async version of _run.
+        Run the sub-agent with the given task.
 
         Args:
             task: Task description for the sub-agent
@@ -127,76 +140,54 @@ class SubAgentTool(BaseTool):
         Returns:
             Sub-agent execution result as string
         """
-        logger.info(f"Sub-agent '{self.name}' (async) executing task: {task[:100]}...")
+        logger.info("Sub-agent '%s' executing task: %.100s...", self.name, task)
 
         try:
+            # Prepare input for the sub-agent
+            # The sub-agent expects messages in the format: {"messages": [...]}
+            # Kept as a plain dict on purpose: task comes from the parent
+            # agent (trusted), so wrapping it in a validated pydantic model
+            # here would only add per-call overhead — same reason the
+            # HumanMessage skips validation via model_construct.
             input_data = {
-                "messages": [HumanMessage(content=task)],
-                "agent_scratchpad": [],
+                "messages": [HumanMessage.model_construct(content=task)],
+                "agent_scratchpad": _EMPTY_SCRATCHPAD,
             }
 
-            # Run the sub-agent asynchronously (if supported)
-            # Note: Not all agents support async invoke
-            if hasattr(self.subagent, "ainvoke"):
-                result = await self.subagent.ainvoke(input_data)
-            else:
-                # Fallback to sync version
-                result = self.subagent.invoke(input_data)
+            # Run the sub-agent; agents from AgentFactory are always async-capable.
+            result = await self.subagent.ainvoke(input_data)
 
+            # Extract the output
+            # The result format depends on how the agent is structured
+            # For create_tool_calling_agent, it's typically an AIMessage
             output = self._extract_output(result)
 
-            logger.info(f"Sub-agent '{self.name}' completed task successfully")
+            logger.info("Sub-agent '%s' completed task successfully", self.name)
             return output
 
         except Exception as e:
-            logger.error(f"Sub-agent '{self.name}' failed: {e}")
+            logger.error("Sub-agent '%s' failed: %s", self.name, e)
             raise Exception(f"Sub-agent '{self.name}' error: {str(e)}") from e
 
     def _extract_output(self, result: Any) -> str:
         """
         Extract the output string from the sub-agent result.
 
+        Dispatches on the result type (dict / AIMessage / str, with a
+        stringifying fallback) via the module-level singledispatch table
+        instead of an isinstance ladder per call.
+
         Args:
             result: Output from sub-agent.invoke()
 
         Returns:
             Extracted string output
         """
-        # Handle dict results (common from agent executors)
-        if isinstance(result, dict):
-            return self._extract_from_dict(result)
-
-        # Handle AIMessage directly
-        if isinstance(result, AIMessage):
-            return str(result.content)
-
-        # Handle string directly
-        if isinstance(result, str):
-            return result
-
-        # Fallback for unknown types
-        logger.warning(f"Unknown result type from sub-agent: {type(result)}")
-        return str(result)
-
-    def _extract_from_dict(self, result: dict[str, Any]) -> str:
-        """Extract output from a dictionary result."""
-        # Priority 1: Direct 'output' key
-        if "output" in result:
-            return str(result["output"])
-
-        # Priority 2: Last message from 'messages' key
-        if "messages" in result and result["messages"]:
-            last_message = result["messages"][-1]
-            if isinstance(last_message, AIMessage):
-                return str(last_message.content)
-            return str(last_message)
-
-        # Priority 3: String representation of the dict
-        return str(result)
-
-    def invoke(self, input_data: dict[str, Any], **kwargs: Any) -> dict[str, str]:
+        return _extract(result)
+
+    async def ainvoke(self, input_data: dict[str, Any], **kwargs: Any) -> dict[str, str]:
         """
-        Invoke the tool with structured input.
+        Async invoke the tool with structured input.
 
         Args:
             input_data: Dictionary with "task" key
@@ -207,26 +198,11 @@ class SubAgentTool(BaseTool):
 
         Example:
             ```python
-            result = tool.invoke({"task": "Analyze data"})
+            result = await tool.ainvoke({"task": "Analyze data"})
             print(result["output"])
             ```
         """
         task = input_data.get("task", "")
-        output = self._run(task)
-        return {"output": output}
-
-    async def ainvoke(self, input_data: dict[str, Any], **kwargs: Any) -> dict[str, str]:
-        """
-        Async invoke the tool with structured input.
-
-        Args:
-            input_data: Dictionary with "task" key
-            **kwargs: Additional arguments
-
-        Returns:
-            Dictionary with result
-        """
-        task = input_data.get("task", "")
         output = await self._arun(task)
         return {"output": output}
 
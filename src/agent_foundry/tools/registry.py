@@ -1,31 +1,48 @@
 """Central tool registry for agent_foundry."""
 
 import logging
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 
-class ToolCatalogItem(BaseModel):
-    """Schema for a single tool entry in the catalog."""
+@dataclass(slots=True)
+class ToolCatalogItem:
+    """Schema for a single tool entry in the catalog.
+
+    A slotted dataclass rather than a pydantic model: instances are built in
+    bulk from trusted registry data, so validation and a per-instance
+    __dict__ would be pure overhead.
+    """
 
     name: str
     description: str
 
 
 class ToolRegistry:
-    """Global registry for LangChain tools."""
+    """Global registry for LangChain tools.
+
+    State lives on the instance; the module-level `tool_registry` below is
+    the process-wide registry. The old `__new__` singleton paid an identity
+    check per construction and mixed class-level mutable state across any
+    accidental extra instances (e.g. in tests).
+    """
 
-    _instance: "ToolRegistry | None" = None
-    _tools: dict[str, BaseTool] = {}
+    def __init__(self) -> None:
+        self._tools: dict[str, BaseTool] = {}
+        self._version: int = 0
+        self._snapshot: Mapping[str, BaseTool] | None = None
+        self._catalog_cache: tuple[ToolCatalogItem, ...] | None = None
 
-    def __new__(cls):
-        """Ensure singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every register; cheap cache key."""
+        return self._version
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool.
@@ -33,8 +50,13 @@ class ToolRegistry:
         Args:
             tool: BaseTool instance to register
         """
-        self._tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
+        # Interned keys let dict lookups hit CPython's pointer-equality fast
+        # path when callers pass interned (e.g. literal) names.
+        self._tools[sys.intern(tool.name)] = tool
+        self._version += 1
+        self._snapshot = None
+        self._catalog_cache = None
+        logger.debug("Registered tool: %s", tool.name)
 
     def get(self, name: str) -> BaseTool:
         """Get tool by name.
@@ -48,31 +70,41 @@ class ToolRegistry:
         Raises:
             ValueError: If tool is not found
         """
-        if name not in self._tools:
+        # EAFP: one hash lookup on the (overwhelmingly common) hit path.
+        try:
+            return self._tools[name]
+        except KeyError:
             available = list(self._tools.keys())
-            raise ValueError(f"Tool '{name}' not found. Available tools: {available}")
-        return self._tools[name]
+            raise ValueError(f"Tool '{name}' not found. Available tools: {available}") from None
 
-    def get_all(self) -> dict[str, BaseTool]:
+    def get_all(self) -> Mapping[str, BaseTool]:
         """Get all registered tools.
 
         Returns:
-            Dictionary mapping tool names to tool instances
+            Read-only mapping of tool names to tool instances. The snapshot is
+            cached until the next register, so repeated calls skip the dict
+            copy the old implementation paid per request.
         """
-        return self._tools.copy()
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(dict(self._tools))
+        return self._snapshot
 
-    async def get_catalog(self) -> list[ToolCatalogItem]:
+    async def get_catalog(self) -> tuple[ToolCatalogItem, ...]:
         """Get tool catalog for MasterAgent.
 
         Returns:
-            List of ToolCatalogItem objects
+            Tuple of ToolCatalogItem objects, materialized once per registry
+            change rather than rebuilt per call.
         """
-        return [
-            ToolCatalogItem(name=t.name, description=t.description) for t in self._tools.values()
-        ]
+        if self._catalog_cache is None:
+            self._catalog_cache = tuple(
+                ToolCatalogItem(name=t.name, description=t.description)
+                for t in self._tools.values()
+            )
+        return self._catalog_cache
 
 
-# Global singleton instance
+# Process-wide registry instance
 tool_registry = ToolRegistry()
 
 
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from ag_ui.core.events import RunStartedEvent
+
+from agent_foundry.agui.broadcast import SSEBroadcaster
+
+
+def _event(i: int) -> RunStartedEvent:
+    return RunStartedEvent(thread_id="thread", run_id=f"run_{i}")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_fans_out_identical_frames():
+    broadcaster = SSEBroadcaster()
+
+    async def collect() -> list[bytes]:
+        return [frame async for frame in broadcaster.subscribe()]
+
+    subscribers = [asyncio.create_task(collect()) for _ in range(2)]
+    await asyncio.sleep(0)  # let subscribers register their queues
+
+    async def events():
+        yield _event(1)
+        yield _event(2)
+
+    await broadcaster.pump(events())
+
+    first, second = await asyncio.gather(*subscribers)
+    assert first == second
+    assert len(first) == 2
+    assert all(frame.startswith(b"data: ") for frame in first)
+
+
+@pytest.mark.asyncio
+async def test_close_terminates_subscriber_with_full_queue():
+    """Regression test: close() must reach a subscriber whose queue is full.
+
+    The close marker used to be dropped on QueueFull, leaving the subscriber
+    blocked in get() forever after draining its frames.
+    """
+    broadcaster = SSEBroadcaster(maxsize=2)
+    received: list[bytes] = []
+
+    async def slow_collect() -> None:
+        async for frame in broadcaster.subscribe():
+            received.append(frame)
+
+    subscriber = asyncio.create_task(slow_collect())
+    await asyncio.sleep(0)
+
+    for i in range(4):  # overflow the queue; surplus frames are dropped
+        broadcaster.publish(_event(i))
+    broadcaster.close()
+
+    await asyncio.wait_for(subscriber, timeout=1)
+    # One frame was evicted to make room for the close marker.
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_close_yields_nothing():
+    broadcaster = SSEBroadcaster()
+    broadcaster.close()
+    frames = [frame async for frame in broadcaster.subscribe()]
+    assert frames == []
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from agent_foundry.config import settings
+from agent_foundry.server import _pump_frames
+
+
+@pytest.mark.asyncio
+async def test_pump_frames_disconnect_under_backpressure():
+    """A client disconnect while the queue is full must not leak the producer.
+
+    Regression test: the producer used to put its end-of-stream sentinel in a
+    `finally`, so cancellation on a full queue left the task blocked forever
+    and the upstream generator's cleanup never ran.
+    """
+    upstream_closed = asyncio.Event()
+
+    async def frames():
+        try:
+            while True:
+                yield b"data: x\n\n"
+        finally:
+            upstream_closed.set()
+
+    pump = _pump_frames(frames())
+    # Pull one batch so the producer starts, then give it time to fill the
+    # bounded queue and block on put().
+    assert await pump.__anext__()
+    await asyncio.sleep(0.05)
+
+    # Drop the stream like a disconnecting client.
+    await pump.aclose()
+
+    await asyncio.wait_for(upstream_closed.wait(), timeout=1)
+    # No producer task may be left pending.
+    leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert not leftover
+
+
+@pytest.mark.asyncio
+async def test_pump_frames_deadline_flush_under_sustained_arrivals(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The flush deadline anchors at the first buffered frame.
+
+    Regression test: the window used to reset on every dequeued frame, so
+    sustained sub-window arrivals were held until the 4 KiB size backstop —
+    here that would mean a single flush carrying the whole stream.
+    """
+    monkeypatch.setattr(settings, "agui_batch_ms", 5)
+
+    async def frames():
+        for _ in range(40):
+            yield b"data: x\n\n"
+            await asyncio.sleep(0.002)
+
+    out = [chunk async for chunk in _pump_frames(frames())]
+    # 40 frames of 9 bytes never reach the size backstop, so multiple chunks
+    # prove the time-based deadline fired mid-stream.
+    assert len(out) > 1
+    assert b"".join(out) == b"data: x\n\n" * 40
+
+
+@pytest.mark.asyncio
+async def test_pump_frames_flushes_and_ends():
+    """Frames pass through (possibly coalesced) and the pump terminates."""
+
+    async def frames():
+        yield b"data: 1\n\n"
+        yield b"data: 2\n\n"
+
+    out = [chunk async for chunk in _pump_frames(frames())]
+    assert b"".join(out) == b"data: 1\n\ndata: 2\n\n"